@@ -0,0 +1,30 @@
+"""Synthesize speech and stream it straight to disk.
+
+Audio chunks are written as they arrive, so peak memory stays at one chunk
+and the first bytes hit disk before synthesis finishes. The 1 MiB writer
+buffer batches small chunks into few syscalls without buffering the whole
+response.
+"""
+
+import os
+import sys
+
+from fish_audio_sdk import Session, TTSRequest
+
+
+def main() -> None:
+    session = Session(os.environ["FISH_API_KEY"])
+
+    text = sys.argv[1] if len(sys.argv) > 1 else "Hello, world!"
+    output_file = sys.argv[2] if len(sys.argv) > 2 else "output.mp3"
+
+    # Lower bitrate means fewer bytes per second of audio on the wire.
+    request = TTSRequest(text=text, format="mp3", mp3_bitrate=64)
+
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        for chunk in session.tts(request):
+            f.write(chunk)
+
+
+if __name__ == "__main__":
+    main()
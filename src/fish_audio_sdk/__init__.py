@@ -1,14 +1,56 @@
-from .apis import Session
-from .exceptions import HttpCodeErr
-from .schemas import ASRRequest, TTSRequest, ReferenceAudio
-from .websocket import WebSocketSession, AsyncWebSocketSession
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .apis import Session
+    from .cache import CacheBackend, MemoryCacheBackend
+    from .exceptions import HttpCodeErr
+    from .io import AudioStream, AsyncAudioStream
+    from .schemas import ASRRequest, TTSRequest, ReferenceAudio
+    from .websocket import WebSocketSession, AsyncWebSocketSession
 
 __all__ = [
     "Session",
+    "CacheBackend",
+    "MemoryCacheBackend",
     "HttpCodeErr",
+    "AudioStream",
+    "AsyncAudioStream",
     "ReferenceAudio",
     "TTSRequest",
     "ASRRequest",
     "WebSocketSession",
     "AsyncWebSocketSession",
 ]
+
+# PEP 562 lazy imports: importing the package stays cheap, and e.g. pure
+# REST users never pay for the websocket stack.
+_LAZY_SUBMODULES = {
+    "Session": ".apis",
+    "CacheBackend": ".cache",
+    "MemoryCacheBackend": ".cache",
+    "HttpCodeErr": ".exceptions",
+    "AudioStream": ".io",
+    "AsyncAudioStream": ".io",
+    "ReferenceAudio": ".schemas",
+    "TTSRequest": ".schemas",
+    "ASRRequest": ".schemas",
+    "WebSocketSession": ".websocket",
+    "AsyncWebSocketSession": ".websocket",
+}
+
+
+def __getattr__(name: str):
+    try:
+        submodule = _LAZY_SUBMODULES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
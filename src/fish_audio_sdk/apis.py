@@ -1,8 +1,18 @@
-from typing import Generator, Literal
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncGenerator, BinaryIO, Generator, Iterable, Literal
 
 import ormsgpack
 
-from .io import G, GStream, RemoteCall, Request, convert, convert_stream
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+from .exceptions import HttpCodeErr
+from .io import G, GStream, RemoteCall, Request, S, convert, convert_simple, convert_stream
 from .schemas import (
     APICreditEntity,
     ASRRequest,
@@ -13,35 +23,202 @@ from .schemas import (
     TTSRequest,
 )
 
+_MSGPACK_HEADERS = {"Content-Type": "application/msgpack"}
+_ASR_HEADERS = {
+    "Content-Type": "application/msgpack",
+    "Accept": "application/msgpack",
+}
+_ASR_ZSTD_HEADERS = {**_ASR_HEADERS, "Content-Encoding": "zstd"}
+
+# Endpoint paths shared by the sync and async variants of each call, so
+# httpx's URL merge cache in io._join_url always sees the same string.
+_TTS_PATH = "/v1/tts"
+_ASR_PATH = "/v1/asr"
+_API_CREDIT_PATH = "/wallet/self/api-credit"
+_PACKAGE_PATH = "/wallet/self/package"
+
+# Pre-encoded msgpack fixstr keys of the ASR payload, in ASRRequest
+# field order.
+_ASR_KEY_AUDIO = b"\xa5audio"
+_ASR_KEY_LANGUAGE = b"\xa8language"
+_ASR_KEY_IGNORE_TIMESTAMPS = b"\xb1ignore_timestamps"
+
+
+def _asr_bin_header(size: int) -> bytes:
+    if size < 1 << 8:
+        return b"\xc4" + size.to_bytes(1, "big")
+    if size < 1 << 16:
+        return b"\xc5" + size.to_bytes(2, "big")
+    return b"\xc6" + size.to_bytes(4, "big")
+
+
+def _pack_asr_parts(request: ASRRequest) -> list[bytes]:
+    """
+    Msgpack-encode an ASR request as a list of fragments, identical on
+    the wire to ``ormsgpack.packb(request, option=OPT_SERIALIZE_PYDANTIC)``.
+    Packing by hand keeps the multi-megabyte audio buffer out of the
+    serializer: it is passed through by reference instead of being
+    copied into a freshly allocated payload.
+    """
+    audio = request.audio
+    return [
+        b"\x83",
+        _ASR_KEY_AUDIO,
+        _asr_bin_header(len(audio)),
+        audio,
+        _ASR_KEY_LANGUAGE,
+        ormsgpack.packb(request.language),
+        _ASR_KEY_IGNORE_TIMESTAMPS,
+        ormsgpack.packb(request.ignore_timestamps),
+    ]
+
+
+def _parse_asr_response(response) -> ASRResponse:
+    # Long transcripts carry hundreds of segments, so the reply is
+    # requested as msgpack and decoded without a JSON text pass;
+    # servers that ignore the Accept header still get the JSON path.
+    if "msgpack" in response.headers.get("content-type", ""):
+        return ASRResponse.model_validate(ormsgpack.unpackb(response.content))
+    return ASRResponse.model_validate_json(response.content)
+
+
+def _is_compressed_audio(audio: bytes) -> bool:
+    # mp3 (ID3 tag or bare frame sync, which also covers ADTS AAC), ogg
+    # and flac are already entropy-coded; zstd would spend CPU on them
+    # to save nothing.
+    return (
+        audio[:3] == b"ID3"
+        or audio[:4] in (b"OggS", b"fLaC")
+        or audio[:2] >= b"\xff\xe0"
+    )
+
 
 class Session(RemoteCall):
     @convert_stream
-    def tts(self, request: TTSRequest) -> GStream:
+    def tts(self, request: TTSRequest, chunk_size: int | None = None) -> GStream:
+        """
+        ``chunk_size`` controls how many bytes each iteration yields;
+        larger values (e.g. ``64 * 1024``) cut per-chunk overhead for
+        bulk downloads, while the default hands chunks on as the network
+        delivers them, which keeps time-to-first-audio low.
+        """
         yield Request(
             method="POST",
-            url="/v1/tts",
-            headers={"Content-Type": "application/msgpack"},
-            content=ormsgpack.packb(request.model_dump()),
+            url=_TTS_PATH,
+            headers=_MSGPACK_HEADERS,
+            content=request.packb(),
+            chunk_size=chunk_size,
         )
+        # Returning no relay generator tells convert_stream to pass the
+        # response chunks through untouched.
 
-        def g() -> Generator[bytes, bytes, None]:
-            chunk = yield b""
-            while True:
-                chunk = yield chunk
-                if chunk == b"":
-                    break
-
-        return g()
+    @convert
+    def asr(self, request: ASRRequest, compress: bool = False) -> G[ASRResponse]:
+        """
+        ``compress`` zstd-compresses the upload (PCM and WAV audio
+        typically shrinks 40-60%, cutting upload time on slow links).
+        It requires the ``zstandard`` package and is skipped for audio
+        that is already entropy-coded (mp3, ogg, flac); in either case
+        the request falls back to an uncompressed upload.
+        """
+        content = _pack_asr_parts(request)
+        headers = _ASR_HEADERS
+        if (
+            compress
+            and zstandard is not None
+            and not _is_compressed_audio(request.audio)
+        ):
+            cobj = zstandard.ZstdCompressor(level=3).compressobj()
+            compressed = [c for c in map(cobj.compress, content) if c]
+            compressed.append(cobj.flush())
+            content = compressed
+            headers = _ASR_ZSTD_HEADERS
+        response = yield Request(
+            method="POST",
+            url=_ASR_PATH,
+            headers=headers,
+            content=content,
+        )
+        return _parse_asr_response(response)
 
     @convert
-    def asr(self, request: ASRRequest) -> G[ASRResponse]:
+    def _asr_packed(self, content: list[bytes]) -> G[ASRResponse]:
+        # Transport half of asr_binding: the caller already holds the
+        # fully packed payload fragments.
         response = yield Request(
             method="POST",
-            url="/v1/asr",
-            headers={"Content-Type": "application/msgpack"},
-            content=ormsgpack.packb(request.model_dump()),
+            url=_ASR_PATH,
+            headers=_ASR_HEADERS,
+            content=content,
+        )
+        return _parse_asr_response(response)
+
+    def asr_binding(
+        self,
+        *,
+        language: str | None = None,
+        ignore_timestamps: bool | None = None,
+    ):
+        """
+        Bind the invariant fields of an ASR request once and get back a
+        ``transcribe(audio)`` callable (with an ``.awaitable`` twin,
+        like the other endpoints). The msgpack fragments around the
+        audio are packed here, once per binding, so a tight loop over
+        thousands of clips only encodes each clip's length header
+        instead of re-packing the same fields every call.
+        """
+        prefix = b"\x83" + _ASR_KEY_AUDIO
+        suffix = (
+            _ASR_KEY_LANGUAGE
+            + ormsgpack.packb(language)
+            + _ASR_KEY_IGNORE_TIMESTAMPS
+            + ormsgpack.packb(ignore_timestamps)
         )
-        return ASRResponse.model_validate(response.json())
+
+        def transcribe(audio: bytes) -> ASRResponse:
+            return self._asr_packed(
+                [prefix, _asr_bin_header(len(audio)), audio, suffix]
+            )
+
+        async def awaitable(audio: bytes) -> ASRResponse:
+            return await self._asr_packed.awaitable(
+                [prefix, _asr_bin_header(len(audio)), audio, suffix]
+            )
+
+        transcribe.awaitable = awaitable
+        return transcribe
+
+    async def asr_many(
+        self,
+        requests: Iterable[ASRRequest],
+        *,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+    ) -> list[ASRResponse]:
+        """
+        Transcribe a batch concurrently over the shared connection pool,
+        bounded by ``max_concurrency`` so a large batch neither exhausts
+        the pool nor trips server-side rate limits. Calls rejected with
+        429 or a 5xx are retried up to ``max_retries`` times with
+        exponential backoff (``backoff_base * 2**attempt`` seconds);
+        other errors propagate immediately. Responses come back in input
+        order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(request: ASRRequest) -> ASRResponse:
+            async with semaphore:
+                for attempt in range(max_retries):
+                    try:
+                        return await self.asr.awaitable(request)
+                    except HttpCodeErr as exc:
+                        if exc.status != 429 and exc.status < 500:
+                            raise
+                        await asyncio.sleep(backoff_base * 2**attempt)
+                return await self.asr.awaitable(request)
+
+        return list(await asyncio.gather(*(one(r) for r in requests)))
 
     @convert
     def list_models(
@@ -74,12 +251,62 @@ class Session(RemoteCall):
                 }
             ),
         )
-        return PaginatedResponse[ModelEntity].model_validate(response.json())
+        return PaginatedResponse[ModelEntity].model_validate_json(response.content)
+
+    def list_all_models(
+        self, *, page_size: int = 10, max_concurrency: int = 8, **filters
+    ) -> Generator[ModelEntity, None, None]:
+        """
+        Iterate every model matching ``filters`` (the keyword arguments of
+        ``list_models``). The first page reveals the total, then the
+        remaining pages are fetched concurrently over the shared
+        connection pool, bounded by ``max_concurrency``.
+        """
+        first = self.list_models(page_size=page_size, page_number=1, **filters)
+        yield from first.items
+        total_pages = -(-first.total // page_size)
+        if total_pages <= 1:
+            return
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            pages = executor.map(
+                lambda n: self.list_models(
+                    page_size=page_size, page_number=n, **filters
+                ),
+                range(2, total_pages + 1),
+            )
+            for page in pages:
+                yield from page.items
+
+    async def list_all_models_async(
+        self, *, page_size: int = 10, max_concurrency: int = 8, **filters
+    ) -> AsyncGenerator[ModelEntity, None]:
+        first = await self.list_models.awaitable(
+            page_size=page_size, page_number=1, **filters
+        )
+        for item in first.items:
+            yield item
+        total_pages = -(-first.total // page_size)
+        if total_pages <= 1:
+            return
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(page_number: int) -> PaginatedResponse[ModelEntity]:
+            async with semaphore:
+                return await self.list_models.awaitable(
+                    page_size=page_size, page_number=page_number, **filters
+                )
+
+        pages = await asyncio.gather(
+            *(fetch(n) for n in range(2, total_pages + 1))
+        )
+        for page in pages:
+            for item in page.items:
+                yield item
 
     @convert
     def get_model(this, model_id: str) -> G[ModelEntity]:
         response = yield Request(method="GET", url=f"/model/{model_id}")
-        return ModelEntity.model_validate(response.json())
+        return ModelEntity.model_validate_json(response.content)
 
     @convert
     def create_model(
@@ -89,9 +316,9 @@ class Session(RemoteCall):
         type: Literal["tts"] = "tts",
         title: str,
         description: str | None = None,
-        cover_image: bytes | None = None,
+        cover_image: bytes | BinaryIO | Path | None = None,
         train_mode: Literal["fast"] = "fast",
-        voices: list[bytes],
+        voices: list[bytes | BinaryIO | Path],
         texts: list[str] | None = None,
         tags: list[str] | None = None,
         enhance_audio_quality: bool = True,
@@ -102,27 +329,28 @@ class Session(RemoteCall):
         if tags is None:
             tags = []
 
-        files = [("voices", voice) for voice in voices]
-        if cover_image is not None:
-            files.append(("cover_image", cover_image))
-        response = yield Request(
-            method="POST",
-            url="/model",
-            data=filter_none(
-                {
-                    "visibility": visibility,
-                    "type": type,
-                    "title": title,
-                    "description": description,
-                    "train_mode": train_mode,
-                    "texts": texts,
-                    "tags": tags,
-                    "enhance_audio_quality": enhance_audio_quality,
-                }
-            ),
-            files=files,
-        )
-        return ModelEntity.model_validate(response.json())
+        with contextlib.ExitStack() as stack:
+            files = [("voices", _as_upload(voice, stack)) for voice in voices]
+            if cover_image is not None:
+                files.append(("cover_image", _as_upload(cover_image, stack)))
+            response = yield Request(
+                method="POST",
+                url="/model",
+                data=filter_none(
+                    {
+                        "visibility": visibility,
+                        "type": type,
+                        "title": title,
+                        "description": description,
+                        "train_mode": train_mode,
+                        "texts": texts,
+                        "tags": tags,
+                        "enhance_audio_quality": enhance_audio_quality,
+                    }
+                ),
+                files=files,
+            )
+        return ModelEntity.model_validate_json(response.content)
 
     @convert
     def delete_model(this, model_id: str) -> G[None]:
@@ -135,36 +363,71 @@ class Session(RemoteCall):
         *,
         title: str | None = None,
         description: str | None = None,
-        cover_image: bytes | None = None,
+        cover_image: bytes | BinaryIO | Path | None = None,
         visibility: Literal["public", "unlist", "private"] | None = None,
         tags: list[str] | None = None,
     ) -> G[None]:
-        files = []
-        if cover_image is not None:
-            files.append(("cover_image", cover_image))
-        yield Request(
-            method="PATCH",
-            url=f"/model/{model_id}",
-            data=filter_none(
-                {
-                    "title": title,
-                    "description": description,
-                    "visibility": visibility,
-                    "tags": tags,
-                }
+        # No list allocation (and no multipart consideration in httpx)
+        # on the common no-cover-image path.
+        data = filter_none(
+            {
+                "title": title,
+                "description": description,
+                "visibility": visibility,
+                "tags": tags,
+            }
+        )
+        if cover_image is None:
+            yield Request(method="PATCH", url=f"/model/{model_id}", data=data)
+            return
+        with contextlib.ExitStack() as stack:
+            yield Request(
+                method="PATCH",
+                url=f"/model/{model_id}",
+                data=data,
+                files=[("cover_image", _as_upload(cover_image, stack))],
+            )
+
+    @convert_simple
+    def get_api_credit(this, *, cache_ttl: float | None = None) -> S[APICreditEntity]:
+        """
+        ``cache_ttl`` serves repeated calls within that many seconds
+        from memory, which suits balance polling; by default every call
+        hits the API.
+        """
+        return (
+            Request(
+                method="GET", url=_API_CREDIT_PATH, cache_ttl=cache_ttl
             ),
-            files=files,
+            lambda response: APICreditEntity.model_validate_json(response.content),
         )
 
-    @convert
-    def get_api_credit(this) -> G[APICreditEntity]:
-        response = yield Request(method="GET", url="/wallet/self/api-credit")
-        return APICreditEntity.model_validate(response.json())
+    @convert_simple
+    def get_package(this, *, cache_ttl: float | None = None) -> S[PackageEntity]:
+        """
+        ``cache_ttl`` serves repeated calls within that many seconds
+        from memory, which suits balance polling; by default every call
+        hits the API.
+        """
+        return (
+            Request(method="GET", url=_PACKAGE_PATH, cache_ttl=cache_ttl),
+            lambda response: PackageEntity.model_validate_json(response.content),
+        )
 
-    @convert
-    def get_package(this) -> G[PackageEntity]:
-        response = yield Request(method="GET", url="/wallet/self/package")
-        return PackageEntity.model_validate(response.json())
+
+def _as_upload(
+    value: bytes | BinaryIO | Path, stack: contextlib.ExitStack
+) -> bytes | BinaryIO:
+    # Paths are opened rather than read so httpx's multipart encoder can
+    # stream the file from disk instead of holding it in memory; httpx
+    # does not close caller-supplied file objects, so the stack closes
+    # them once the response has arrived.
+    if isinstance(value, Path):
+        return stack.enter_context(value.open("rb"))
+    return value
 
 
-filter_none = lambda d: {k: v for k, v in d.items() if v is not None}
+def filter_none(d: dict) -> dict:
+    for key in [k for k, v in d.items() if v is None]:
+        del d[key]
+    return d
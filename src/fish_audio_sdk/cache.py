@@ -0,0 +1,45 @@
+import hashlib
+from collections import OrderedDict
+
+
+def cache_key(method: str, url: str, content: bytes) -> bytes:
+    """
+    Digest of the already-packed request body, so hitting the cache never
+    re-serializes anything.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(method.encode())
+    h.update(url.encode())
+    h.update(content)
+    return h.digest()
+
+
+class CacheBackend:
+    def get(self, key: bytes) -> bytes | None:
+        raise NotImplementedError
+
+    def set(self, key: bytes, value: bytes) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache for synthesized audio. A hit replays the stored
+    bytes without issuing any request.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, bytes] = OrderedDict()
+
+    def get(self, key: bytes) -> bytes | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: bytes) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class HttpCodeErr(Exception):
     status: int
     message: str
@@ -9,10 +9,14 @@ class HttpCodeErr(Exception):
     def __init__(self, status: int, message: str):
         self.status = status
         self.message = message
-        super().__init__(f"{status} {message}")
+        # slots=True rebuilds the class, which breaks zero-argument
+        # super() inside methods carried over from the original body.
+        Exception.__init__(self, f"{status} {message}")
 
 
 class WebSocketErr(Exception):
     """
     {"event": "finish", "reason": "error"} or WebSocketDisconnect
     """
+
+    __slots__ = ()
@@ -2,7 +2,8 @@ import datetime
 import decimal
 from typing import Annotated, Generic, Literal, TypeVar
 
-from pydantic import BaseModel, Field, conint
+import ormsgpack
+from pydantic import BaseModel, Field, PrivateAttr, conint
 
 Item = TypeVar("Item")
 
@@ -33,6 +34,25 @@ class TTSRequest(BaseModel):
     latency: Literal["normal", "balanced"] = "balanced"
     prosody: Prosody | None = None
 
+    _packed: bytes | None = PrivateAttr(default=None)
+
+    def packb(self) -> bytes:
+        """
+        Msgpack encoding of this request, memoized until a field is
+        reassigned. In-place mutation of nested values (e.g. appending to
+        ``references``) does not invalidate the cache.
+        """
+        packed = self._packed
+        if packed is None:
+            packed = ormsgpack.packb(self, option=ormsgpack.OPT_SERIALIZE_PYDANTIC)
+            self._packed = packed
+        return packed
+
+    def __setattr__(self, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if name != "_packed":
+            self._packed = None
+
 
 class ASRRequest(BaseModel):
     audio: bytes
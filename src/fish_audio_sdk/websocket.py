@@ -1,14 +1,155 @@
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import sys
+import threading
 from typing import AsyncGenerator, AsyncIterable, Generator, Iterable
 
 import httpx
 import ormsgpack
+import wsproto.events
 from httpx_ws import WebSocketDisconnect, connect_ws, aconnect_ws
 
 from .exceptions import WebSocketErr
 
-from .schemas import CloseEvent, StartEvent, TTSRequest, TextEvent
+from .schemas import CloseEvent, StartEvent, TTSRequest
+
+# The stop frame has no variable fields, so pack it once at import time.
+_CLOSE_EVENT_BYTES = ormsgpack.packb(CloseEvent().model_dump())
+
+# Bound once so the per-frame decode in the receive loops skips the
+# module attribute lookup.
+_unpackb = ormsgpack.unpackb
+
+# Keep upgraded-then-released connections around so back-to-back tts
+# calls reuse the TCP+TLS session instead of re-handshaking. HTTP/2 is
+# deliberately not enabled here: the websocket upgrade in httpx_ws
+# requires an HTTP/1.1 connection.
+_WS_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=10,
+    keepalive_expiry=60,
+)
+
+# Interned once so the receive loops compare against the same string
+# objects every iteration, letting the equality checks take the pointer
+# fast path whenever the parser returns an interned string.
+_EVENT_AUDIO = sys.intern("audio")
+_EVENT_FINISH = sys.intern("finish")
+_REASON_ERROR = sys.intern("error")
+_REASON_STOP = sys.intern("stop")
+
+# msgpack layout of an audio frame whose first two entries are
+# "event": "audio" followed by the "audio" key: fixstr(5) markers are
+# 0xa5, so the map body starts with these bytes.
+_AUDIO_FRAME_PREFIX = b"\xa5event\xa5audio\xa5audio"
+
+
+def _parse_audio_frame(message: bytes) -> memoryview | None:
+    """
+    Extract the audio payload from a frame without a full msgpack parse.
+
+    Nearly every received frame is ``{"event": "audio", "audio": <bin>}``
+    in exactly that key order, so the payload can be sliced straight out
+    of the buffer. The slice is a memoryview over the frame rather than
+    a copy; callers that hand it to user code convert to bytes, while
+    the chunk-accumulation path appends it without an intermediate
+    allocation. Returns None for any other layout, in which case the
+    caller falls back to ``ormsgpack.unpackb``.
+    """
+    if message[:1] not in (b"\x82", b"\x83") or not message.startswith(
+        _AUDIO_FRAME_PREFIX, 1
+    ):
+        return None
+    offset = 1 + len(_AUDIO_FRAME_PREFIX)
+    if offset >= len(message):
+        return None
+    marker = message[offset]
+    if marker == 0xC4:  # bin 8
+        start = offset + 2
+    elif marker == 0xC5:  # bin 16
+        start = offset + 3
+    elif marker == 0xC6:  # bin 32
+        start = offset + 5
+    else:
+        return None
+    if start > len(message):
+        return None
+    length = int.from_bytes(message[offset + 1 : start], "big")
+    if start + length > len(message):
+        return None
+    return memoryview(message)[start : start + length]
+
+
+# Sentinel returned by _handle_frame when the server signals a clean
+# stop, distinguishing it from frames that simply carry no audio.
+_STREAM_DONE = object()
+
+# Frames above this size are decoded in a worker thread on the async
+# path rather than on the event loop; below it the thread hop costs
+# more than the decode.
+_OFFLOAD_DECODE_BYTES = 16 * 1024
+
+
+def _classify_event(data: dict) -> bytes | object | None:
+    # Checked in frequency order: nearly every frame is audio.
+    event = data["event"]
+    if event == _EVENT_AUDIO:
+        return data["audio"]
+    if event == _EVENT_FINISH:
+        reason = data["reason"]
+        if reason == _REASON_ERROR:
+            raise WebSocketErr
+        if reason == _REASON_STOP:
+            return _STREAM_DONE
+    return None
+
+
+def _drain_pending(ws, messages: list[bytes]) -> None:
+    """
+    Move any bytes frames the background receiver has already queued
+    into ``messages`` without awaiting, so a consumer that fell behind
+    handles them in one scheduler pass instead of paying an event-loop
+    round trip per frame. Only bytes frames are taken; control and
+    close events are left for the awaited receive path. Peeks
+    httpx_ws's internal delivery stream, so if that layout ever changes
+    draining degrades to a no-op.
+    """
+    try:
+        receiver = ws._receive_event
+        queued = receiver._state.buffer
+    except AttributeError:
+        return
+    while queued and type(queued[0]) is wsproto.events.BytesMessage:
+        messages.append(receiver.receive_nowait().data)
+
+
+def _handle_frame(message: bytes) -> bytes | memoryview | object | None:
+    """
+    Classify one received frame: the audio payload, ``_STREAM_DONE`` on
+    a clean finish, or None for frames that carry nothing to yield.
+    Raises WebSocketErr when the server reports an error. Shared by the
+    sync and async receive loops so the per-frame logic exists once.
+    """
+    audio = _parse_audio_frame(message)
+    if audio is not None:
+        return audio
+    return _classify_event(_unpackb(message))
+
+
+async def _ahandle_frame(message: bytes) -> bytes | memoryview | object | None:
+    """
+    Async twin of _handle_frame. Frames too large to decode inline are
+    unpacked in a worker thread so other event-loop work keeps running
+    (ormsgpack releases the GIL while it decodes). The slice fast path
+    never decodes, so the thread hop only applies to oversized frames
+    in an unexpected key order.
+    """
+    audio = _parse_audio_frame(message)
+    if audio is not None:
+        return audio
+    if len(message) > _OFFLOAD_DECODE_BYTES:
+        return _classify_event(await asyncio.to_thread(_unpackb, message))
+    return _classify_event(_unpackb(message))
 
 
 class WebSocketSession:
@@ -18,14 +159,29 @@ class WebSocketSession:
         *,
         base_url: str = "https://api.fish.audio",
         max_workers: int = 10,
+        warm_on_init: bool = False,
     ):
         self._apikey = apikey
         self._base_url = base_url
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._auth_headers = {"Authorization": f"Bearer {apikey}"}
+        # max_workers is kept for backwards compatibility; each tts call
+        # now runs its sender on a short-lived thread of its own, so the
+        # session no longer holds a ThreadPoolExecutor open.
         self._client = httpx.Client(
             base_url=self._base_url,
-            headers={"Authorization": f"Bearer {self._apikey}"},
+            headers=self._auth_headers,
+            limits=_WS_LIMITS,
         )
+        if warm_on_init:
+            threading.Thread(target=self.warmup, daemon=True).start()
+
+    def warmup(self):
+        # Establish DNS + TCP + TLS ahead of the first tts call; the
+        # upgraded connection comes from the same keep-alive pool.
+        try:
+            self._client.head("/")
+        except httpx.HTTPError:
+            pass
 
     def __enter__(self):
         return self
@@ -36,46 +192,143 @@ class WebSocketSession:
     def close(self):
         self._client.close()
 
+    @staticmethod
+    def _coalesced_sender(
+        send_text,
+        text_stream: Iterable[str],
+        flush_interval_ms: float,
+        min_flush_chars: int,
+    ) -> None:
+        # Thread twin of AsyncWebSocketSession._coalesced_sender: pump
+        # the user iterable through a queue so the linger timeout waits
+        # on queue.get instead of blocking in next().
+        items: queue.Queue[str | None] = queue.Queue()
+
+        def pump():
+            try:
+                for text in text_stream:
+                    items.put(text)
+            finally:
+                items.put(None)
+
+        pump_thread = threading.Thread(target=pump, daemon=True)
+        pump_thread.start()
+        interval = flush_interval_ms / 1000
+        pending: list[str] = []
+        pending_chars = 0
+
+        def flush():
+            nonlocal pending, pending_chars
+            if pending:
+                send_text("".join(pending))
+                pending = []
+                pending_chars = 0
+
+        while True:
+            if pending:
+                try:
+                    text = items.get(timeout=interval)
+                except queue.Empty:
+                    flush()
+                    continue
+            else:
+                text = items.get()
+            if text is None:
+                break
+            pending.append(text)
+            pending_chars += len(text)
+            if pending_chars >= min_flush_chars:
+                flush()
+        flush()
+        pump_thread.join()
+
     def tts(
-        self, request: TTSRequest, text_stream: Iterable[str]
+        self,
+        request: TTSRequest,
+        text_stream: Iterable[str],
+        *,
+        flush_interval_ms: float | None = None,
+        min_flush_chars: int = 60,
+        min_chunk_bytes: int = 0,
     ) -> Generator[bytes, None, None]:
+        """
+        When ``flush_interval_ms`` is set, incoming texts are coalesced
+        into one text event per ``min_flush_chars`` characters or linger
+        interval, whichever comes first, instead of one websocket frame
+        per item. This keeps word-by-word LLM streams from paying frame,
+        TLS-record and syscall overhead per word.
+
+        When ``min_chunk_bytes`` is positive, received audio frames are
+        accumulated and yielded in chunks of at least that many bytes,
+        so consumers that write to a file or playback buffer are not
+        woken per tiny network frame.
+        """
         with connect_ws("/v1/tts/live", client=self._client) as ws:
 
+            def send_text(text: str) -> None:
+                # Hot path: one frame per text item. A literal dict packs
+                # to the same bytes as TextEvent(...).model_dump() without
+                # the pydantic construction and dump per item.
+                ws.send_bytes(ormsgpack.packb({"event": "text", "text": text}))
+
             def sender():
                 ws.send_bytes(
                     ormsgpack.packb(
-                        StartEvent(request=request).model_dump(),
+                        # request was validated when the caller built it;
+                        # model_construct skips re-validation here.
+                        StartEvent.model_construct(request=request),
+                        option=ormsgpack.OPT_SERIALIZE_PYDANTIC,
                     )
                 )
-                for text in text_stream:
-                    ws.send_bytes(
-                        ormsgpack.packb(
-                            TextEvent(text=text).model_dump(),
-                        )
+                if flush_interval_ms is None:
+                    for text in text_stream:
+                        send_text(text)
+                else:
+                    self._coalesced_sender(
+                        send_text, text_stream, flush_interval_ms, min_flush_chars
                     )
-                ws.send_bytes(
-                    ormsgpack.packb(
-                        CloseEvent().model_dump(),
-                    )
-                )
+                ws.send_bytes(_CLOSE_EVENT_BYTES)
+
+            sender_error: list[BaseException] = []
+
+            def run_sender():
+                try:
+                    sender()
+                except BaseException as exc:
+                    sender_error.append(exc)
 
-            sender_future = self._executor.submit(sender)
+            sender_thread = threading.Thread(target=run_sender, daemon=True)
+            sender_thread.start()
 
+            # Locals resolve with LOAD_FAST in the per-frame loop,
+            # skipping an attribute and a global lookup per iteration.
+            receive_bytes = ws.receive_bytes
+            handle_frame = _handle_frame
+            buffer = bytearray()
             while True:
                 try:
-                    message = ws.receive_bytes()
-                    data = ormsgpack.unpackb(message)
-                    match data["event"]:
-                        case "audio":
-                            yield data["audio"]
-                        case "finish" if data["reason"] == "error":
-                            raise WebSocketErr
-                        case "finish" if data["reason"] == "stop":
-                            break
+                    message = receive_bytes()
                 except WebSocketDisconnect:
                     raise WebSocketErr
+                audio = handle_frame(message)
+                if audio is _STREAM_DONE:
+                    break
+                if audio is not None:
+                    if min_chunk_bytes <= 0:
+                        # Yield bytes regardless of which parse path ran,
+                        # so callers never see a memoryview.
+                        yield audio if type(audio) is bytes else bytes(audio)
+                    else:
+                        buffer += audio
+                        if len(buffer) >= min_chunk_bytes:
+                            yield bytes(buffer)
+                            buffer.clear()
+            if buffer:
+                yield bytes(buffer)
 
-            sender_future.result()
+            sender_thread.join()
+            if sender_error:
+                raise sender_error[0]
 
 
 class AsyncWebSocketSession:
@@ -87,11 +340,21 @@ class AsyncWebSocketSession:
     ):
         self._apikey = apikey
         self._base_url = base_url
+        self._auth_headers = {"Authorization": f"Bearer {apikey}"}
         self._client = httpx.AsyncClient(
             base_url=self._base_url,
-            headers={"Authorization": f"Bearer {self._apikey}"},
+            headers=self._auth_headers,
+            limits=_WS_LIMITS,
         )
 
+    async def warmup(self):
+        # Establish DNS + TCP + TLS ahead of the first tts call; the
+        # upgraded connection comes from the same keep-alive pool.
+        try:
+            await self._client.head("/")
+        except httpx.HTTPError:
+            pass
+
     async def __aenter__(self):
         return self
 
@@ -101,43 +364,183 @@ class AsyncWebSocketSession:
     async def close(self):
         await self._client.aclose()
 
+    @staticmethod
+    async def _coalesced_sender(
+        send_text,
+        text_stream: AsyncIterable[str],
+        flush_interval_ms: float,
+        min_flush_chars: int,
+    ) -> None:
+        # Pump the user stream through a queue so the linger timeout can
+        # cancel a plain queue.get instead of the stream's __anext__.
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+        async def pump():
+            try:
+                async for text in text_stream:
+                    await queue.put(text)
+            finally:
+                await queue.put(None)
+
+        pump_task = asyncio.get_running_loop().create_task(pump())
+        interval = flush_interval_ms / 1000
+        pending: list[str] = []
+        pending_chars = 0
+
+        async def flush():
+            nonlocal pending, pending_chars
+            if pending:
+                await send_text("".join(pending))
+                pending = []
+                pending_chars = 0
+
+        try:
+            while True:
+                if pending:
+                    try:
+                        text = await asyncio.wait_for(queue.get(), interval)
+                    except asyncio.TimeoutError:
+                        await flush()
+                        continue
+                else:
+                    text = await queue.get()
+                if text is None:
+                    break
+                pending.append(text)
+                pending_chars += len(text)
+                if pending_chars >= min_flush_chars:
+                    await flush()
+            await flush()
+        finally:
+            pump_task.cancel()
+
     async def tts(
-        self, request: TTSRequest, text_stream: AsyncIterable[str]
+        self,
+        request: TTSRequest,
+        text_stream: AsyncIterable[str] | Iterable[str],
+        *,
+        flush_interval_ms: float | None = None,
+        min_flush_chars: int = 60,
+        min_chunk_bytes: int = 0,
+        prefetch_frames: int = 0,
     ) -> AsyncGenerator[bytes, None]:
+        """
+        When ``flush_interval_ms`` is set, incoming texts are coalesced
+        into one text event per ``min_flush_chars`` characters or linger
+        interval, whichever comes first, instead of one websocket frame
+        per item. This keeps word-by-word LLM streams from paying frame,
+        TLS-record and syscall overhead per word.
+
+        When ``min_chunk_bytes`` is positive, received audio frames are
+        accumulated and yielded in chunks of at least that many bytes,
+        so consumers that write to a file or playback buffer are not
+        woken per tiny network frame.
+
+        When ``prefetch_frames`` is positive, a background task keeps
+        receiving up to that many frames ahead of the consumer, so a
+        consumer that does real work between chunks (playback, encoding)
+        no longer head-of-line blocks the websocket while it is busy.
+        """
+        # Packing the start frame can take milliseconds when the request
+        # embeds reference audio blobs; do it in a worker thread before
+        # the connection opens so the event loop never stalls on it
+        # (ormsgpack releases the GIL while packing). model_construct
+        # skips re-validation: the caller already validated the request.
+        start_frame = await asyncio.to_thread(
+            ormsgpack.packb,
+            StartEvent.model_construct(request=request),
+            option=ormsgpack.OPT_SERIALIZE_PYDANTIC,
+        )
         async with aconnect_ws("/v1/tts/live", client=self._client) as ws:
 
+            async def send_text(text: str) -> None:
+                # Hot path: one frame per text item. A literal dict packs to
+                # the same bytes as TextEvent(...).model_dump() without the
+                # pydantic construction and dump per item.
+                await ws.send_bytes(ormsgpack.packb({"event": "text", "text": text}))
+
             async def sender():
-                await ws.send_bytes(
-                    ormsgpack.packb(
-                        StartEvent(request=request).model_dump(),
-                    )
-                )
-                async for text in text_stream:
-                    await ws.send_bytes(
-                        ormsgpack.packb(
-                            TextEvent(text=text).model_dump(),
-                        )
-                    )
-                await ws.send_bytes(
-                    ormsgpack.packb(
-                        CloseEvent().model_dump(),
+                await ws.send_bytes(start_frame)
+                if not isinstance(text_stream, AsyncIterable):
+                    for text in text_stream:
+                        await send_text(text)
+                elif flush_interval_ms is None:
+                    async for text in text_stream:
+                        await send_text(text)
+                else:
+                    await self._coalesced_sender(
+                        send_text, text_stream, flush_interval_ms, min_flush_chars
                     )
+                await ws.send_bytes(_CLOSE_EVENT_BYTES)
+
+            if isinstance(text_stream, (list, tuple)):
+                # The text is already materialized, so there is nothing to
+                # overlap with receiving; send it all up front and skip the
+                # task plumbing.
+                await sender()
+                sender_future = None
+            else:
+                sender_future = asyncio.get_running_loop().create_task(sender())
+
+            if prefetch_frames > 0:
+                frames: asyncio.Queue[bytes | BaseException] = asyncio.Queue(
+                    maxsize=prefetch_frames
                 )
 
-            sender_future = asyncio.get_running_loop().create_task(sender())
+                async def reader():
+                    try:
+                        while True:
+                            await frames.put(await ws.receive_bytes())
+                    except BaseException as exc:
+                        await frames.put(exc)
 
-            while True:
-                try:
-                    message = await ws.receive_bytes()
-                    data = ormsgpack.unpackb(message)
-                    match data["event"]:
-                        case "audio":
-                            yield data["audio"]
-                        case "finish" if data["reason"] == "error":
+                reader_task = asyncio.get_running_loop().create_task(reader())
+            else:
+                reader_task = None
+
+            try:
+                # Locals resolve with LOAD_FAST in the per-frame loop,
+                # skipping an attribute and a global lookup per iteration.
+                receive_bytes = ws.receive_bytes
+                ahandle_frame = _ahandle_frame
+                buffer = bytearray()
+                messages: list[bytes] = []
+                done = False
+                while not done:
+                    if reader_task is None:
+                        try:
+                            messages.append(await receive_bytes())
+                        except WebSocketDisconnect:
                             raise WebSocketErr
-                        case "finish" if data["reason"] == "stop":
+                        _drain_pending(ws, messages)
+                    else:
+                        item = await frames.get()
+                        if isinstance(item, BaseException):
+                            if isinstance(item, WebSocketDisconnect):
+                                raise WebSocketErr
+                            raise item
+                        messages.append(item)
+                    for message in messages:
+                        audio = await ahandle_frame(message)
+                        if audio is _STREAM_DONE:
+                            done = True
                             break
-                except WebSocketDisconnect:
-                    raise WebSocketErr
+                        if audio is not None:
+                            if min_chunk_bytes <= 0:
+                                # Yield bytes regardless of which parse path
+                                # ran, so callers never see a memoryview.
+                                yield audio if type(audio) is bytes else bytes(audio)
+                            else:
+                                buffer += audio
+                                if len(buffer) >= min_chunk_bytes:
+                                    yield bytes(buffer)
+                                    buffer.clear()
+                    messages.clear()
+                if buffer:
+                    yield bytes(buffer)
+            finally:
+                if reader_task is not None:
+                    reader_task.cancel()
 
-            await sender_future
+            if sender_future is not None:
+                await sender_future
@@ -0,0 +1,63 @@
+import httpx
+
+from fish_audio_sdk import AudioStream, AsyncAudioStream, Session, TTSRequest
+
+
+class ByteStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, chunks: list[bytes]):
+        self._chunks = chunks
+
+    def __iter__(self):
+        yield from self._chunks
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+def make_session() -> Session:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=ByteStream([b"one", b"two", b"three"]))
+
+    session = Session("apikey")
+    transport = httpx.MockTransport(handler)
+    session._sync_client = httpx.Client(
+        transport=transport, base_url="https://api.fish.audio"
+    )
+    session._async_client = httpx.AsyncClient(
+        transport=transport, base_url="https://api.fish.audio"
+    )
+    return session
+
+
+def test_tts_returns_iterable_stream():
+    session = make_session()
+    stream = session.tts(TTSRequest(text="Hello, world!"))
+    assert isinstance(stream, AudioStream)
+    assert b"".join(stream) == b"onetwothree"
+
+
+def test_tts_collect():
+    session = make_session()
+    assert session.tts(TTSRequest(text="Hello, world!")).collect() == b"onetwothree"
+
+
+async def test_tts_async_collect():
+    session = make_session()
+    stream = session.tts.awaitable(TTSRequest(text="Hello, world!"))
+    assert isinstance(stream, AsyncAudioStream)
+    assert await stream.collect() == b"onetwothree"
+
+
+def test_tts_write_to(tmp_path):
+    session = make_session()
+    output = tmp_path / "r.mp3"
+    session.tts(TTSRequest(text="Hello, world!")).write_to(output)
+    assert output.read_bytes() == b"onetwothree"
+
+
+async def test_tts_async_write_to(tmp_path):
+    session = make_session()
+    output = tmp_path / "r.mp3"
+    await session.tts.awaitable(TTSRequest(text="Hello, world!")).write_to(output)
+    assert output.read_bytes() == b"onetwothree"
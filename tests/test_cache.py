@@ -0,0 +1,72 @@
+import httpx
+
+from fish_audio_sdk import MemoryCacheBackend, Session, TTSRequest
+
+
+class ByteStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    # A response built from `content=` is marked consumed up front, which
+    # iter_raw rejects; a stream subclass behaves like a live response body.
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def __iter__(self):
+        yield self._data
+
+    async def __aiter__(self):
+        yield self._data
+
+
+def make_session(calls: list) -> Session:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, stream=ByteStream(b"audio-bytes"))
+
+    session = Session("apikey", cache=MemoryCacheBackend(max_size=2))
+    transport = httpx.MockTransport(handler)
+    session._sync_client = httpx.Client(
+        transport=transport, base_url="https://api.fish.audio"
+    )
+    session._async_client = httpx.AsyncClient(
+        transport=transport, base_url="https://api.fish.audio"
+    )
+    return session
+
+
+def test_tts_cache_hit():
+    calls: list = []
+    session = make_session(calls)
+
+    request = TTSRequest(text="Hello, world!")
+    first = b"".join(session.tts(request))
+    second = b"".join(session.tts(request))
+
+    assert first == second == b"audio-bytes"
+    assert len(calls) == 1
+
+
+async def test_tts_cache_hit_async():
+    calls: list = []
+    session = make_session(calls)
+
+    request = TTSRequest(text="Hello, world!")
+
+    async def collect() -> bytes:
+        buffer = bytearray()
+        async for chunk in session.tts.awaitable(request):
+            buffer.extend(chunk)
+        return bytes(buffer)
+
+    assert await collect() == b"audio-bytes"
+    assert await collect() == b"audio-bytes"
+    assert len(calls) == 1
+
+
+def test_memory_cache_evicts_oldest():
+    cache = MemoryCacheBackend(max_size=2)
+    cache.set(b"a", b"1")
+    cache.set(b"b", b"2")
+    cache.set(b"c", b"3")
+
+    assert cache.get(b"a") is None
+    assert cache.get(b"b") == b"2"
+    assert cache.get(b"c") == b"3"
@@ -0,0 +1,36 @@
+import httpx
+import pytest
+
+from fish_audio_sdk import HttpCodeErr
+from fish_audio_sdk.exceptions import WebSocketErr
+from fish_audio_sdk.io import RemoteCall
+
+
+def test_http_code_err_attributes():
+    err = HttpCodeErr(status=404, message="Not Found")
+    assert err.status == 404
+    assert err.message == "Not Found"
+    assert str(err) == "404 Not Found"
+
+
+def test_http_code_err_can_be_caught():
+    with pytest.raises(HttpCodeErr) as exc_info:
+        raise HttpCodeErr(402, "Payment Required")
+    assert exc_info.value.status == 402
+
+
+def test_websocket_err_can_be_raised():
+    with pytest.raises(WebSocketErr):
+        raise WebSocketErr
+
+
+def test_non_json_error_body_uses_text():
+    resp = httpx.Response(
+        502,
+        headers={"content-type": "text/html"},
+        content=b"<html>Bad Gateway</html>",
+    )
+    with pytest.raises(HttpCodeErr) as exc_info:
+        RemoteCall._try_raise_http_exception(resp)
+    assert exc_info.value.status == 502
+    assert exc_info.value.message == "<html>Bad Gateway</html>"
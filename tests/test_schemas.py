@@ -0,0 +1,22 @@
+import ormsgpack
+
+from fish_audio_sdk import TTSRequest
+
+
+def test_tts_request_packb_is_memoized():
+    request = TTSRequest(text="Hello, world!")
+    packed = request.packb()
+
+    assert packed is request.packb()
+    assert ormsgpack.unpackb(packed) == request.model_dump()
+
+
+def test_tts_request_packb_invalidated_on_assignment():
+    request = TTSRequest(text="Hello, world!")
+    packed = request.packb()
+
+    request.text = "Goodbye, world!"
+    repacked = request.packb()
+
+    assert repacked != packed
+    assert ormsgpack.unpackb(repacked)["text"] == "Goodbye, world!"